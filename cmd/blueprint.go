@@ -7,6 +7,7 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"text/template"
 
 	bp "github.com/cowdogmoo/warpgate/pkg/blueprint"
@@ -74,6 +75,26 @@ var showBlueprintCmd = &cobra.Command{
 	},
 }
 
+var (
+	bpTmplOnce    sync.Once
+	cfgTmpl       *template.Template
+	packerTmpl    *template.Template
+	provisionTmpl *template.Template
+)
+
+// loadBlueprintTemplates parses the blueprint scaffolding templates once so
+// every create operation reuses the already-compiled templates.
+func loadBlueprintTemplates() {
+	bpTmplOnce.Do(func() {
+		cfgTmpl = template.Must(
+			template.ParseFiles(filepath.Join("templates", "config.yaml.tmpl")))
+		packerTmpl = template.Must(
+			template.ParseFiles(filepath.Join("templates", "packer.pkr.hcl.tmpl")))
+		provisionTmpl = template.Must(
+			template.ParseFiles(filepath.Join("templates", "provision.sh.tmpl")))
+	})
+}
+
 func genBPDirs(newBlueprint string) error {
 	if newBlueprint != "" {
 		bpDirs := []string{"packer_templates", "scripts"}
@@ -165,9 +186,7 @@ func generatePackerTemplate(baseInput string) packer.PackerTemplates {
 }
 
 func createCfg(blueprint bp.Blueprint) error {
-	// Parse the input config template
-	tmpl := template.Must(
-		template.ParseFiles(filepath.Join("templates", "config.yaml.tmpl")))
+	loadBlueprintTemplates()
 
 	// Create the templated config file for the new blueprint
 	cfgFile := filepath.Join("blueprints", blueprint.Name, "config.yaml")
@@ -178,7 +197,7 @@ func createCfg(blueprint bp.Blueprint) error {
 
 	defer f.Close()
 
-	if err := tmpl.Execute(f, blueprint); err != nil {
+	if err := cfgTmpl.Execute(f, blueprint); err != nil {
 		return fmt.Errorf(color.RedString("failed to create config.yaml: %v", err))
 	}
 
@@ -186,8 +205,7 @@ func createCfg(blueprint bp.Blueprint) error {
 }
 
 func createPacker(blueprint bp.Blueprint) error {
-	// Parse the input config template
-	tmpl := template.Must(template.ParseFiles(filepath.Join("templates", "packer.pkr.hcl.tmpl")))
+	loadBlueprintTemplates()
 	newBPPath := filepath.Join("blueprints", blueprint.Name)
 
 	viper.AddConfigPath(newBPPath)
@@ -230,7 +248,7 @@ func createPacker(blueprint bp.Blueprint) error {
 		return fmt.Errorf(color.RedString("failed to create %s: %v", filepath.Join(packerDir, blueprint.Name), err))
 	}
 	defer f.Close()
-	if err := tmpl.Execute(f, tmplData); err != nil {
+	if err := packerTmpl.Execute(f, tmplData); err != nil {
 		return fmt.Errorf(color.RedString("failed to populate %s with templated data: %v", filepath.Join(packerDir, blueprint.Name), err))
 	}
 
@@ -244,7 +262,7 @@ func createPacker(blueprint bp.Blueprint) error {
 }
 
 func createScript(bpName string) error {
-	tmpl := template.Must(template.ParseFiles(filepath.Join("templates", "provision.sh.tmpl")))
+	loadBlueprintTemplates()
 
 	// Create the templated config file for the new blueprint
 	scriptFile := filepath.Join("blueprints", bpName, "scripts", "provision.sh")
@@ -255,7 +273,7 @@ func createScript(bpName string) error {
 
 	defer f.Close()
 
-	if err := tmpl.Execute(f, bpName); err != nil {
+	if err := provisionTmpl.Execute(f, bpName); err != nil {
 		return fmt.Errorf(color.RedString("failed to create provision.sh: %v", err))
 	}
 
@@ -306,6 +324,11 @@ func listBlueprints() {
 		cobra.CheckErr(err)
 	}
 	for _, f := range files {
+		// DirEntry carries the type from the directory read itself, so
+		// filtering out stray files costs no extra stat calls.
+		if !f.IsDir() {
+			continue
+		}
 		fmt.Println(f.Name())
 	}
 	os.Exit(0)
@@ -321,46 +344,21 @@ func showBlueprint(blueprintName string) {
 		cobra.CheckErr(err)
 	}
 
+	// One unmarshal of the blueprint key fills the whole tree, including
+	// the nested packer template, AMI, and container sections, so there
+	// is no need to walk the config once per sub-section.
 	if err := viper.UnmarshalKey(bp.BlueprintKey, &blueprint); err != nil {
 		log.L().Errorf("Failed to unmarshal blueprint: %v", err)
 		cobra.CheckErr(err)
 	}
 
-	if err := viper.UnmarshalKey(bp.PackerTemplatesKey, &blueprint.PackerTemplates); err != nil {
-		log.L().Errorf("Failed to unmarshal packer templates: %v", err)
-		cobra.CheckErr(err)
-	}
-
-	if err := viper.UnmarshalKey("packer_templates.ami", &blueprint.PackerTemplates.AMI); err != nil {
-		log.L().Errorf("Failed to unmarshal AMI information for template %d: %v", err)
-		cobra.CheckErr(err)
-	}
-	if err := viper.UnmarshalKey("packer_templates.container", &blueprint.PackerTemplates.Container); err != nil {
-		log.L().Errorf("Failed to unmarshal container information for template %d: %v", err)
-		cobra.CheckErr(err)
-	}
-	if err := viper.UnmarshalKey("packer_templates.container.base_image_values", &blueprint.PackerTemplates.Container.BaseImageValues); err != nil {
-		log.L().Errorf("Failed to unmarshal base image values for template %d: %v", err)
-		cobra.CheckErr(err)
-	}
-	if err := viper.UnmarshalKey("packer_templates.container.registry", &blueprint.PackerTemplates.Container.ImageRegistry); err != nil {
-		log.L().Errorf("Failed to unmarshal registry information for template %d: %v", err)
-		cobra.CheckErr(err)
-	}
-	if err := viper.UnmarshalKey("packer_templates.container.image_hashes", &blueprint.PackerTemplates.Container.ImageHashes); err != nil {
-		log.L().Errorf("Failed to unmarshal image hashes for template %d: %v", err)
-		cobra.CheckErr(err)
-	}
-	if err := viper.UnmarshalKey("packer_templates.container.workdir", &blueprint.PackerTemplates.Container.Workdir); err != nil {
-		log.L().Errorf("Failed to unmarshal workdir information for template %d: %v", err)
-		cobra.CheckErr(err)
-	}
-
-	blueprintJSON, err := json.MarshalIndent(blueprint, "", "  ")
-	if err != nil {
+	// Encode straight to stdout rather than materializing an indented
+	// byte slice plus a string copy of it first.
+	enc := json.NewEncoder(os.Stdout)
+	enc.SetIndent("", "  ")
+	if err := enc.Encode(blueprint); err != nil {
 		log.L().Errorf("Failed to marshal blueprint to JSON: %v", err)
 		cobra.CheckErr(err)
 	}
-	fmt.Println(string(blueprintJSON))
 	os.Exit(0)
 }
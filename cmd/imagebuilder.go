@@ -1,6 +1,7 @@
 package cmd
 
 import (
+	"context"
 	"fmt"
 	"path/filepath"
 
@@ -18,6 +19,12 @@ var (
 	imageBuilderCmd = &cobra.Command{
 		Use:   "imageBuilder",
 		Short: "Build a container image using packer and a provisioning repo",
+		// Only the build path needs packer and docker on the PATH, so the
+		// dependency probe runs here rather than in initConfig, keeping
+		// lightweight commands (help, blueprint list) free of it.
+		PreRunE: func(cmd *cobra.Command, args []string) error {
+			return depCheck()
+		},
 		RunE: func(cmd *cobra.Command, args []string) error {
 			blueprintName, err := cmd.Flags().GetString("blueprint")
 			if err != nil {
@@ -136,7 +143,7 @@ func RunImageBuilder(cmd *cobra.Command, args []string, blueprint bp.Blueprint)
 			return err
 		}
 
-		if err := dockerClient.ProcessTemplates(blueprint.PackerTemplates, blueprint.Name); err != nil {
+		if err := dockerClient.ProcessTemplates(context.Background(), blueprint.PackerTemplates, blueprint.Name); err != nil {
 			return fmt.Errorf("error processing Packer template: %v", err)
 		}
 	}
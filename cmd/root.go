@@ -74,19 +74,14 @@ func initConfig() {
 
 	err = log.Initialize(warpConfigDir, cfg.Log.Level, cfg.Log.LogPath)
 	checkErr(err, "Failed to initialize the logger: %v")
-
-	// Check for required dependencies after initializing the logger
-	checkErr(depCheck(), "Dependency check failed")
 }
 
 func createConfig(cfgPath string) {
 	cfgDir := filepath.Dir(cfgPath)
 
-	// Ensure the configuration directory exists
-	if _, err := os.Stat(cfgDir); os.IsNotExist(err) {
-		fmt.Printf("Creating config directory %s", cfgDir)
-		checkErr(os.MkdirAll(cfgDir, os.ModePerm), "failed to create config directory %s: %v")
-	}
+	// Ensure the configuration directory exists; MkdirAll is a no-op if
+	// it already does
+	checkErr(os.MkdirAll(cfgDir, os.ModePerm), "failed to create config directory %s: %v")
 
 	// Write the default config file if it does not exist
 	if _, err := os.Stat(cfgPath); os.IsNotExist(err) {
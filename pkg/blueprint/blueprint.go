@@ -8,6 +8,7 @@ import (
 	"reflect"
 	"strings"
 	"sync"
+	"time"
 
 	"github.com/cowdogmoo/warpgate/pkg/packer"
 	gitutils "github.com/l50/goutils/v2/git"
@@ -142,6 +143,21 @@ func (b *Blueprint) Initialize() error {
 	return nil
 }
 
+// The repo root cannot change within a single invocation and resolving
+// it shells out to git, so memoize the first lookup.
+var (
+	repoRootOnce sync.Once
+	repoRootPath string
+	repoRootErr  error
+)
+
+func cachedRepoRoot() (string, error) {
+	repoRootOnce.Do(func() {
+		repoRootPath, repoRootErr = gitutils.RepoRoot()
+	})
+	return repoRootPath, repoRootErr
+}
+
 // CreateBuildDir creates a temporary build directory and copies the repo into it.
 //
 // **Returns:**
@@ -157,25 +173,37 @@ func (b *Blueprint) CreateBuildDir() error {
 	}
 
 	buildDir := filepath.Join(os.TempDir(), "builds", "warpgate")
-	if _, err := os.Stat(buildDir); os.IsNotExist(err) {
-		if err := os.MkdirAll(buildDir, 0755); err != nil {
-			return fmt.Errorf("failed to create build directory %s: %v", buildDir, err)
-		}
+	// MkdirAll is already a no-op for existing directories, so no
+	// pre-flight stat is needed.
+	if err := os.MkdirAll(buildDir, 0755); err != nil {
+		return fmt.Errorf("failed to create build directory %s: %v", buildDir, err)
 	}
 
-	repoRoot, err := gitutils.RepoRoot()
+	repoRoot, err := cachedRepoRoot()
 	if err != nil {
 		return fmt.Errorf("failed to get repo root: %v", err)
 	}
 
-	// Copy the warpgate repo to the build directory, excluding .git
+	// Copy the warpgate repo to the build directory, excluding .git.
+	// Files whose destination already matches the source size and mtime
+	// are skipped, so repeat builds only copy what actually changed.
+	// PreserveTimes keeps source mtimes on the copies so the comparison
+	// holds across runs.
 	opt := recursiveCp.Options{
 		Skip: func(srcinfo os.FileInfo, src, dest string) (bool, error) {
 			if srcinfo.IsDir() && srcinfo.Name() == ".git" {
 				return true, nil
 			}
+			if srcinfo.Mode().IsRegular() {
+				if destinfo, err := os.Stat(dest); err == nil &&
+					destinfo.Size() == srcinfo.Size() &&
+					destinfo.ModTime().Equal(srcinfo.ModTime()) {
+					return true, nil
+				}
+			}
 			return false, nil
 		},
+		PreserveTimes: true,
 	}
 	if err := recursiveCp.Copy(repoRoot, buildDir, opt); err != nil {
 		return fmt.Errorf("failed to copy repo to build directory: %v", err)
@@ -203,6 +231,9 @@ func (b *Blueprint) LoadPackerTemplates(githubToken string) error {
 	b.PackerTemplates = &packer.PackerTemplates{}
 	fmt.Printf("Config file used by viper: %s\n", configFile)
 
+	// A single unmarshal of the packer_templates key populates the nested
+	// AMI and Container settings as well, so no per-section unmarshal
+	// passes over the config are needed.
 	if err := viper.UnmarshalKey("blueprint.packer_templates", b.PackerTemplates); err != nil {
 		return fmt.Errorf("failed to unmarshal packer templates: %v", err)
 	}
@@ -212,31 +243,6 @@ func (b *Blueprint) LoadPackerTemplates(githubToken string) error {
 		return fmt.Errorf("no packer templates found in %s config file", configFile)
 	}
 
-	if err := b.unmarshalTemplates(githubToken); err != nil {
-		return err
-	}
-
-	return nil
-}
-
-func (b *Blueprint) unmarshalTemplates(githubToken string) error {
-	// Unmarshal AMI if present
-	amiKey := "packer_templates.ami"
-	if viper.IsSet(amiKey) {
-		if err := viper.UnmarshalKey(amiKey, &b.PackerTemplates.AMI); err != nil {
-			return fmt.Errorf("failed to unmarshal AMI settings for template: %v", err)
-		}
-	}
-
-	// Unmarshal Container if present
-	containerKey := "packer_templates.container"
-	if viper.IsSet(containerKey) {
-		b.PackerTemplates.Container.ImageRegistry.Credential = githubToken
-		if err := viper.UnmarshalKey(containerKey, &b.PackerTemplates.Container); err != nil {
-			return fmt.Errorf("failed to unmarshal container settings for template: %v", err)
-		}
-	}
-
 	return nil
 }
 
@@ -365,6 +371,14 @@ func (b *Blueprint) buildPackerImage() (map[string]string, error) {
 		return nil, fmt.Errorf("failed to initialize blueprint: %v", err)
 	}
 
+	// The container configuration does not change between attempts, so
+	// unmarshal it once here instead of on every retry.
+	if b.PackerTemplates != nil {
+		if err := viper.UnmarshalKey(ContainerKey, &b.PackerTemplates.Container); err != nil {
+			return nil, fmt.Errorf("failed to unmarshal container parameters from %s config file: %v", b.Name, err)
+		}
+	}
+
 	const maxRetries = 3
 	var lastError error
 	imageHashes := make(map[string]string)
@@ -373,7 +387,13 @@ func (b *Blueprint) buildPackerImage() (map[string]string, error) {
 		if err != nil {
 			lastError = err
 			fmt.Printf("Attempt %d failed with error: %v\n", attempt, err) // Log each error
-			continue                                                       // retry
+			if attempt < maxRetries {
+				// Back off briefly so transient failures (registry
+				// hiccups, a busy Docker daemon) can clear before
+				// the next attempt instead of retrying immediately.
+				time.Sleep(time.Duration(attempt) * time.Second)
+			}
+			continue // retry
 		}
 
 		fmt.Printf("Successfully built container image from the %s packer template\n", b.Name)
@@ -432,30 +452,11 @@ func (b *Blueprint) BuildImageAttempt(attempt int) ([]packer.ImageHash, error) {
 		return nil, fmt.Errorf("no packer templates found in %s blueprint", b.Name)
 	}
 
-	if err := viper.UnmarshalKey(ContainerKey, &b.PackerTemplates.Container); err != nil {
-		return nil, fmt.Errorf("failed to unmarshal container parameters from %s config file: %v", b.Name, err)
-	}
-
 	args := b.PreparePackerArgs()
 
 	fmt.Printf("Attempt %d - packer parameters: %s\n", attempt, hideSensitiveArgs(args))
 
-	// Initialize the packer templates directory
-	if err := b.PackerTemplates.RunInit([]string{"."}, filepath.Join(b.Path, "packer_templates")); err != nil {
-		return nil, fmt.Errorf("error initializing packer command: %v", err)
-	}
-
-	// Verify the template directory contents
-	cmd := sys.Cmd{
-		CmdString: "ls",
-		Args:      []string{"-la", b.Path},
-	}
-
-	if _, err := cmd.RunCmd(); err != nil {
-		return nil, fmt.Errorf("failed to list contents of template directory: %v", err)
-	}
-
-	// Run the build command
+	// Run the build command; packer init already ran via Initialize
 	hashes, amiID, err := b.PackerTemplates.RunBuild(args, filepath.Join(b.Path, "packer_templates"))
 	if err != nil {
 		return nil, fmt.Errorf("error running build command: %v", err)
@@ -482,12 +483,20 @@ func (b *Blueprint) BuildImageAttempt(attempt int) ([]packer.ImageHash, error) {
 }
 
 func hideSensitiveArgs(args []string) []string {
-	logArgs := make([]string, len(args))
-	copy(logArgs, args)
-	for i, arg := range logArgs {
+	// Only copy the slice when a sensitive value is actually present;
+	// most argument lists pass through untouched.
+	var logArgs []string
+	for i, arg := range args {
 		if strings.Contains(arg, "registry_cred=") {
+			if logArgs == nil {
+				logArgs = make([]string, len(args))
+				copy(logArgs, args)
+			}
 			logArgs[i] = "-var registry_cred=<HIDDEN>"
 		}
 	}
+	if logArgs == nil {
+		return args
+	}
 	return logArgs
 }
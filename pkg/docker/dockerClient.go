@@ -1,12 +1,14 @@
 package docker
 
 import (
+	"bytes"
 	"context"
 	"errors"
 	"fmt"
 	"io"
 	"os"
 	"strings"
+	"sync"
 
 	"github.com/cowdogmoo/warpgate/pkg/packer"
 	"github.com/docker/docker/api/types/image"
@@ -28,12 +30,12 @@ import (
 // CreateManifest: Creates a Docker manifest list from image tags.
 // GetImageSize: Retrieves the size of a Docker image.
 type DockerClientInterface interface {
-	DockerLogin() error
-	DockerPush(image string) error
-	DockerTag(sourceImage, targetImage string) error
-	CreateAndPushManifest(pTmpl *packer.PackerTemplates, imageTags []string) error
+	DockerLogin(ctx context.Context) error
+	DockerPush(ctx context.Context, image string) error
+	DockerTag(ctx context.Context, sourceImage, targetImage string) error
+	CreateAndPushManifest(ctx context.Context, pTmpl *packer.PackerTemplates, imageTags []string) error
 	CreateManifest(ctx context.Context, targetImage string, imageTags []string) (v1.ImageIndex, error)
-	GetImageSize(imageRef string) (int64, error)
+	GetImageSize(ctx context.Context, imageRef string) (int64, error)
 }
 
 // DockerClient represents a Docker client.
@@ -57,6 +59,12 @@ type DockerClient struct {
 
 // NewDockerClient creates a new Docker client.
 //
+// The tag/push/manifest flow only needs the Docker API client, so the
+// container-storage backed DockerRegistry (an expensive store and runtime
+// initialization) is not created here; callers that need direct store
+// access can build one with NewDockerRegistry and attach it via
+// SetRegistry.
+//
 // **Returns:**
 //
 // *DockerClient: A DockerClient instance.
@@ -67,29 +75,27 @@ func NewDockerClient(registryConfig packer.ContainerImageRegistry) (*DockerClien
 		return nil, fmt.Errorf("error creating Docker client: %v", err)
 	}
 
-	dockerRegistry, err := NewDockerRegistry(registryConfig, DefaultGetStore, true)
-	if err != nil {
-		return nil, fmt.Errorf("error creating Docker registry: %v", err)
-	}
-
 	return &DockerClient{
 		CLI: cli,
 		Container: packer.Container{
 			ImageRegistry: registryConfig,
 			ImageHashes:   []packer.ImageHash{},
 		},
-		Registry: dockerRegistry,
-		Remote:   &RemoteClient{},
+		Remote: &RemoteClient{},
 	}, nil
 }
 
 // DockerLogin authenticates with a Docker registry using the provided
 // credentials.
 //
+// **Parameters:**
+//
+// ctx: The context within which the login is performed.
+//
 // **Returns:**
 //
 // error: An error if the login operation fails.
-func (d *DockerClient) DockerLogin() error {
+func (d *DockerClient) DockerLogin(ctx context.Context) error {
 	if d.Container.ImageRegistry.Username == "" || d.Container.ImageRegistry.Credential == "" || d.Container.ImageRegistry.Server == "" {
 		return errors.New("username, password, and server must not be empty")
 	}
@@ -100,7 +106,7 @@ func (d *DockerClient) DockerLogin() error {
 		ServerAddress: d.Container.ImageRegistry.Server,
 	}
 
-	resp, err := d.CLI.RegistryLogin(context.Background(), authConfig)
+	resp, err := d.CLI.RegistryLogin(ctx, authConfig)
 	if err != nil {
 		return fmt.Errorf("error logging into Docker registry %s: %v", d.Container.ImageRegistry.Server, err)
 	}
@@ -128,18 +134,18 @@ func (d *DockerClient) DockerLogin() error {
 //
 // **Parameters:**
 //
+// ctx: The context within which the image is tagged.
 // sourceImage: The current name of the image.
 // targetImage: The new name to assign to the image.
 //
 // **Returns:**
 //
 // error: An error if the tagging operation fails.
-func (d *DockerClient) DockerTag(sourceImage, targetImage string) error {
+func (d *DockerClient) DockerTag(ctx context.Context, sourceImage, targetImage string) error {
 	if sourceImage == "" || targetImage == "" {
 		return errors.New("sourceImage and targetImage must not be empty")
 	}
 
-	ctx := context.Background()
 	return d.CLI.ImageTag(ctx, sourceImage, targetImage)
 }
 
@@ -148,13 +154,13 @@ func (d *DockerClient) DockerTag(sourceImage, targetImage string) error {
 //
 // **Parameters:**
 //
+// ctx: The context within which the image is pushed.
 // containerImage: The name of the image to push.
-// authStr: The auth string for the Docker registry.
 //
 // **Returns:**
 //
 // error: An error if the push operation fails.
-func (d *DockerClient) PushImage(containerImage string) error {
+func (d *DockerClient) PushImage(ctx context.Context, containerImage string) error {
 	if d.AuthStr == "" {
 		return errors.New("error: docker client is not authenticated with a registry")
 	}
@@ -163,7 +169,6 @@ func (d *DockerClient) PushImage(containerImage string) error {
 		return errors.New("containerImage must not be empty")
 	}
 
-	ctx := context.Background()
 	resp, err := d.CLI.ImagePush(ctx, containerImage, image.PushOptions{
 		RegistryAuth: d.AuthStr,
 	})
@@ -172,8 +177,15 @@ func (d *DockerClient) PushImage(containerImage string) error {
 	}
 	defer resp.Close()
 
-	_, err = io.Copy(os.Stdout, resp)
-	if err != nil {
+	// Buffer the push progress and emit it in a single write once the
+	// push completes, so concurrent pushes do not interleave their
+	// streams byte-wise on stdout.
+	var progress bytes.Buffer
+	if _, err := io.Copy(&progress, resp); err != nil {
+		return fmt.Errorf("error reading push response: %v", err)
+	}
+
+	if _, err := progress.WriteTo(os.Stdout); err != nil {
 		return fmt.Errorf("error copying response to stdout: %v", err)
 	}
 
@@ -185,13 +197,14 @@ func (d *DockerClient) PushImage(containerImage string) error {
 //
 // **Parameters:**
 //
+// ctx: The context within which all registry operations are performed.
 // pTmpl: A PackerTemplate containing the image to process.
 // blueprint: The blueprint containing tag information.
 //
 // **Returns:**
 //
 // error: An error if any operation fails during tagging or pushing.
-func (d *DockerClient) ProcessTemplates(pTmpl *packer.PackerTemplates, blueprintName string) error {
+func (d *DockerClient) ProcessTemplates(ctx context.Context, pTmpl *packer.PackerTemplates, blueprintName string) error {
 	if blueprintName == "" {
 		return errors.New("blueprint name must not be empty")
 	}
@@ -213,25 +226,27 @@ func (d *DockerClient) ProcessTemplates(pTmpl *packer.PackerTemplates, blueprint
 	d.Container.ImageHashes = pTmpl.Container.ImageHashes
 
 	if d.AuthStr == "" {
-		if err := d.DockerLogin(); err != nil {
+		if err := d.DockerLogin(ctx); err != nil {
 			return fmt.Errorf("failed to login to %s: %v", pTmpl.Container.ImageRegistry.Server, err)
 		}
 	}
 
-	// Remove any entries with empty ImageHashes
-	for i := 0; i < len(d.Container.ImageHashes); i++ {
-		if d.Container.ImageHashes[i].Hash == "" {
-			d.Container.ImageHashes = append(d.Container.ImageHashes[:i], d.Container.ImageHashes[i+1:]...)
-			i--
+	// Remove any entries with empty ImageHashes with a single in-place
+	// pass instead of re-splicing the slice for each removal
+	validHashes := d.Container.ImageHashes[:0]
+	for _, hash := range d.Container.ImageHashes {
+		if hash.Hash != "" {
+			validHashes = append(validHashes, hash)
 		}
 	}
+	d.Container.ImageHashes = validHashes
 
-	imageTags, err := d.TagAndPushImages(pTmpl)
+	imageTags, err := d.TagAndPushImages(ctx, pTmpl)
 	if err != nil {
 		return err
 	}
 
-	if err := d.CreateAndPushManifest(pTmpl, imageTags); err != nil {
+	if err := d.CreateAndPushManifest(ctx, pTmpl, imageTags); err != nil {
 		return err
 	}
 
@@ -269,34 +284,66 @@ func (d *DockerClient) SetRegistry(registry *DockerRegistry) {
 //
 // **Parameters:**
 //
+// ctx: The context within which the images are tagged and pushed.
 // pTmpl: The PackerTemplates containing image tag information.
 //
 // **Returns:**
 //
 // []string: A slice of image tags that were successfully pushed.
 // error: An error if any operation fails during tagging or pushing.
-func (d *DockerClient) TagAndPushImages(pTmpl *packer.PackerTemplates) ([]string, error) {
-	var imageTags []string
-
-	for _, hash := range d.Container.ImageHashes {
+func (d *DockerClient) TagAndPushImages(ctx context.Context, pTmpl *packer.PackerTemplates) ([]string, error) {
+	hashes := d.Container.ImageHashes
+	for _, hash := range hashes {
 		if hash.Arch == "" || hash.Hash == "" || hash.OS == "" {
-			return imageTags, errors.New("arch, hash, and OS must not be empty")
+			return nil, errors.New("arch, hash, and OS must not be empty")
 		}
+	}
 
-		localTag := fmt.Sprintf("sha256:%s", hash.Hash)
-		remoteTag := fmt.Sprintf("%s/%s:%s",
-			strings.TrimPrefix(d.Container.ImageRegistry.Server, "https://"),
-			pTmpl.Tag.Name, hash.Arch)
+	// Each architecture's tag and push is independent of the others, so
+	// dispatch them concurrently and collect the tags by index to keep
+	// the manifest ordering deterministic.
+	results := make([]string, len(hashes))
+	errChan := make(chan error, len(hashes))
+	var wg sync.WaitGroup
+
+	for i, hash := range hashes {
+		wg.Add(1)
+		go func(i int, hash packer.ImageHash) {
+			defer wg.Done()
+
+			localTag := fmt.Sprintf("sha256:%s", hash.Hash)
+			remoteTag := fmt.Sprintf("%s/%s:%s",
+				strings.TrimPrefix(d.Container.ImageRegistry.Server, "https://"),
+				pTmpl.Tag.Name, hash.Arch)
+
+			if err := d.DockerTag(ctx, localTag, remoteTag); err != nil {
+				errChan <- err
+				return
+			}
+
+			if err := d.PushImage(ctx, remoteTag); err != nil {
+				errChan <- err
+				return
+			}
+
+			results[i] = remoteTag
+		}(i, hash)
+	}
 
-		if err := d.DockerTag(localTag, remoteTag); err != nil {
-			return imageTags, err
+	wg.Wait()
+	close(errChan)
+
+	var imageTags []string
+	for _, tag := range results {
+		if tag != "" {
+			imageTags = append(imageTags, tag)
 		}
+	}
 
-		if err := d.PushImage(remoteTag); err != nil {
+	for err := range errChan {
+		if err != nil {
 			return imageTags, err
 		}
-
-		imageTags = append(imageTags, remoteTag)
 	}
 
 	if len(imageTags) == 0 {
@@ -365,7 +365,7 @@ func TestPushImage(t *testing.T) {
 					}, nil).Once()
 			}
 
-			err := dockerClient.PushImage(tc.containerImage)
+			err := dockerClient.PushImage(context.Background(), tc.containerImage)
 			if (err != nil) != tc.wantErr {
 				t.Errorf("PushImage() error = %v, wantErr %v", err, tc.wantErr)
 			}
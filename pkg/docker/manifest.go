@@ -66,13 +66,14 @@ type GetStoreFunc func(options storage.StoreOptions) (storage.Store, error)
 //
 // **Parameters:**
 //
+// ctx: The context within which the manifest is created and pushed.
 // pTmpl: Packer templates containing the tag information.
 // imageTags: A slice of image tags to include in the manifest list.
 //
 // **Returns:**
 //
 // error: An error if any operation fails during manifest creation or pushing.
-func (d *DockerClient) CreateAndPushManifest(pTmpl *packer.PackerTemplates, imageTags []string) error {
+func (d *DockerClient) CreateAndPushManifest(ctx context.Context, pTmpl *packer.PackerTemplates, imageTags []string) error {
 	if len(imageTags) == 0 {
 		return fmt.Errorf("no image tags provided for manifest creation")
 	}
@@ -89,13 +90,13 @@ func (d *DockerClient) CreateAndPushManifest(pTmpl *packer.PackerTemplates, imag
 		authn.NewKeychainFromHelper(&customHelper{AuthConfig: authn.AuthConfig{Username: d.AuthConfig.Username, Password: d.AuthStr}}),
 	)
 
-	manifestList, err := d.CreateManifest(context.Background(), targetImage, imageTags, keychain)
+	manifestList, err := d.CreateManifest(ctx, targetImage, imageTags, keychain)
 	if err != nil {
 		return fmt.Errorf("failed to create manifest list for %s: %v", targetImage, unwrapError(err))
 	}
 
 	fmt.Println("Pushing manifest list")
-	if err := d.PushManifest(targetImage, manifestList, keychain); err != nil {
+	if err := d.PushManifest(ctx, targetImage, manifestList, keychain); err != nil {
 		return fmt.Errorf("failed to push manifest list for %s, error: %v", targetImage, unwrapError(err))
 	}
 
@@ -144,14 +145,14 @@ func (d *DockerClient) CreateManifest(ctx context.Context, targetImage string, i
 //
 // **Parameters:**
 //
+// ctx: The context within which the image size is retrieved.
 // imageRef: The reference of the image to get the size of.
 //
 // **Returns:**
 //
 // int64: The size of the image in bytes
 // error: An error if any operation fails during the size retrieval
-func (d *DockerClient) GetImageSize(imageRef string) (int64, error) {
-	ctx := context.Background()
+func (d *DockerClient) GetImageSize(ctx context.Context, imageRef string) (int64, error) {
 	imageInspect, contents, err := d.CLI.ImageInspectWithRaw(ctx, imageRef)
 	if err != nil {
 		return 0, err
@@ -168,6 +169,7 @@ func (d *DockerClient) GetImageSize(imageRef string) (int64, error) {
 //
 // **Parameters:**
 //
+// ctx: The context within which the manifest list is pushed.
 // imageName: The name of the image to push the manifest list for.
 // manifestList: The manifest list to push.
 // keychain: The keychain to use for authentication.
@@ -175,7 +177,7 @@ func (d *DockerClient) GetImageSize(imageRef string) (int64, error) {
 // **Returns:**
 //
 // error: An error if any operation fails during the push.
-func (d *DockerClient) PushManifest(imageName string, manifestList v1.ImageIndex, keychain authn.Keychain) error {
+func (d *DockerClient) PushManifest(ctx context.Context, imageName string, manifestList v1.ImageIndex, keychain authn.Keychain) error {
 	targetRef, err := name.ParseReference(imageName)
 	if err != nil {
 		return fmt.Errorf("failed to parse target reference: %v", err)
@@ -183,6 +185,7 @@ func (d *DockerClient) PushManifest(imageName string, manifestList v1.ImageIndex
 
 	options := []remote.Option{
 		remote.WithAuthFromKeychain(keychain),
+		remote.WithContext(ctx),
 	}
 
 	if err := remote.WriteIndex(targetRef, manifestList, options...); err != nil {
@@ -88,14 +88,10 @@ func (p *PackerTemplates) RunBuild(args []string, dir string) ([]ImageHash, stri
 
 	fmt.Printf("Running Packer build command from the %s directory...\n", dir)
 
-	var outputBuffer bytes.Buffer
-	var mu sync.Mutex // Add a mutex to synchronize access to the buffer
-
+	// runCommand already captures the build output and returns it, so the
+	// handler only needs to stream each line to stdout.
 	outputHandler := func(s string) {
 		fmt.Println(s)
-		mu.Lock() // Lock the mutex before writing to the buffer
-		outputBuffer.WriteString(s)
-		mu.Unlock() // Unlock the mutex after writing to the buffer
 	}
 
 	if len(args) > 0 && args[0] == "build" {
@@ -1,6 +1,7 @@
 package packer
 
 import (
+	"bufio"
 	"fmt"
 	"regexp"
 	"strings"
@@ -93,6 +94,12 @@ type PackerTemplates struct {
 	User        string      `mapstructure:"user"`
 	AMI         AMI         `mapstructure:"ami,omitempty"`
 	Tag         Tag         `mapstructure:"tag"`
+
+	// imageHashesByArch caches the blueprint's image_hashes settings,
+	// indexed by architecture, so repeated parses do not re-walk viper's
+	// configuration map and each matched line resolves its entry with a
+	// single map lookup.
+	imageHashesByArch map[string]map[string]interface{}
 }
 
 // Tag represents the tag configuration for the image built by Packer.
@@ -116,13 +123,23 @@ type Tag struct {
 //
 // string: The AMI ID if found in the output.
 func (p *PackerTemplates) ParseAMIDetails(output string) string {
-	if strings.Contains(output, "AMI:") {
-		parts := strings.Split(output, " ")
-		for i := 0; i < len(parts)-1; i++ {
-			if parts[i] == "AMI:" {
-				return parts[i+1]
+	// Scan for the marker directly instead of splitting the entire build
+	// output into fields, which allocated a slice proportional to the
+	// output size just to find one token.
+	const marker = "AMI: "
+	for idx := strings.Index(output, marker); idx != -1; {
+		if idx == 0 || output[idx-1] == ' ' {
+			amiID := output[idx+len(marker):]
+			if end := strings.IndexByte(amiID, ' '); end != -1 {
+				amiID = amiID[:end]
 			}
+			return amiID
+		}
+		next := strings.Index(output[idx+1:], marker)
+		if next == -1 {
+			break
 		}
+		idx += 1 + next
 	}
 	return ""
 }
@@ -148,32 +165,64 @@ func (p *PackerTemplates) ParseImageHashes(output string) []ImageHash {
 		return p.Container.ImageHashes
 	}
 
-	cleanOutput := removeANSISequences(output)
-	lines := strings.Split(cleanOutput, "\n")
-	fmt.Println("Parsing image hashes from the Packer build output...", lines)
+	fmt.Println("Parsing image hashes from the Packer build output...")
 
-	for _, line := range lines {
+	// Scan the output line by line rather than materializing a slice of
+	// every line (and echoing the whole build log back to stdout).
+	scanner := bufio.NewScanner(strings.NewReader(output))
+	// Verbose provisioner output can produce lines well past the default
+	// 64 KB token limit; size the buffer so such lines do not stop the
+	// scan early.
+	scanner.Buffer(make([]byte, 0, 64*1024), len(output)+1)
+	for scanner.Scan() {
+		line := scanner.Text()
 		if strings.Contains(line, "Imported Docker image: sha256:") {
-			p.parseLine(line, imageHashesConfig)
+			// Packer colorizes whole lines, so escape sequences never
+			// split the marker itself; stripping only the few matched
+			// lines avoids rewriting the entire build output per parse.
+			p.parseLine(removeANSISequences(line), imageHashesConfig)
 		}
 	}
+	if err := scanner.Err(); err != nil {
+		fmt.Printf("Error scanning Packer build output: %v\n", err)
+	}
 	return p.Container.ImageHashes
 }
 
-func (p *PackerTemplates) getImageHashesConfig() []interface{} {
-	imageHashesConfig, ok := viper.Get("blueprint.packer_templates.container.image_hashes").([]interface{})
-	if !ok {
-		return nil
+func (p *PackerTemplates) getImageHashesConfig() map[string]map[string]interface{} {
+	if p.imageHashesByArch == nil {
+		imageHashesConfig, ok := viper.Get("blueprint.packer_templates.container.image_hashes").([]interface{})
+		if !ok {
+			return nil
+		}
+		byArch := make(map[string]map[string]interface{}, len(imageHashesConfig))
+		for _, ihConfig := range imageHashesConfig {
+			ih, ok := ihConfig.(map[string]interface{})
+			if !ok {
+				fmt.Println("Error: invalid image hash config format")
+				continue
+			}
+			arch, ok := ih["arch"].(string)
+			if !ok {
+				fmt.Println("Error: invalid image hash config format")
+				continue
+			}
+			byArch[arch] = ih
+		}
+		p.imageHashesByArch = byArch
 	}
-	return imageHashesConfig
+	return p.imageHashesByArch
 }
 
+// ansiRe matches ANSI escape sequences in Packer output. Compiled once at
+// package scope so every build does not recompile the pattern.
+var ansiRe = regexp.MustCompile(`\x1b\[[0-9;]*[a-zA-Z]`)
+
 func removeANSISequences(output string) string {
-	re := regexp.MustCompile(`\x1b\[[0-9;]*[a-zA-Z]`)
-	return re.ReplaceAllString(output, "")
+	return ansiRe.ReplaceAllString(output, "")
 }
 
-func (p *PackerTemplates) parseLine(line string, imageHashesConfig []interface{}) {
+func (p *PackerTemplates) parseLine(line string, imageHashesByArch map[string]map[string]interface{}) {
 	parts := strings.Fields(line)
 	if len(parts) < 5 {
 		return
@@ -185,16 +234,8 @@ func (p *PackerTemplates) parseLine(line string, imageHashesConfig []interface{}
 		return
 	}
 
-	for _, ihConfig := range imageHashesConfig {
-		ih, ok := ihConfig.(map[string]interface{})
-		if !ok {
-			fmt.Println("Error: invalid image hash config format")
-			continue
-		}
-		if ih["arch"].(string) == arch {
-			p.updateImageHashes(ih, hash)
-			break
-		}
+	if ih, ok := imageHashesByArch[arch]; ok {
+		p.updateImageHashes(ih, hash)
 	}
 }
 
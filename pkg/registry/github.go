@@ -25,6 +25,7 @@ import (
 	"fmt"
 	"io"
 	"net/http"
+	"time"
 )
 
 // HttpClient is an interface that defines the Do method for making HTTP requests.
@@ -32,10 +33,21 @@ type HttpClient interface {
 	Do(req *http.Request) (*http.Response, error)
 }
 
-var Client HttpClient = &http.Client{}
+// Client is the shared HTTP client for GitHub API requests. The transport
+// keeps a small pool of warm keep-alive connections so repeated requests
+// reuse established TCP+TLS sessions instead of paying a fresh handshake.
+var Client HttpClient = &http.Client{
+	Timeout: 30 * time.Second,
+	Transport: &http.Transport{
+		Proxy:               http.ProxyFromEnvironment,
+		MaxIdleConns:        10,
+		MaxIdleConnsPerHost: 4,
+		IdleConnTimeout:     90 * time.Second,
+	},
+}
 
 // ValidateToken checks the validity of a GitHub access token by making
-// a GET request to the GitHub API. If no token is provided as an argument,
+// a HEAD request to the GitHub API. If no token is provided as an argument,
 // it checks for a GITHUB_TOKEN environment variable and uses that.
 // It sets the Authorization header with the token and examines the
 // response status code.
@@ -55,8 +67,10 @@ func ValidateToken(token string) error {
 		return fmt.Errorf("no personal access token provided")
 	}
 
+	// HEAD returns the same status code as GET for this endpoint without
+	// transferring the user profile body we would only throw away.
 	url := "https://api.github.com/user"
-	req, err := http.NewRequest("GET", url, nil)
+	req, err := http.NewRequest(http.MethodHead, url, nil)
 	if err != nil {
 		return fmt.Errorf("error creating request: %v", err)
 	}
@@ -69,14 +83,15 @@ func ValidateToken(token string) error {
 	}
 	defer resp.Body.Close()
 
-	_, err = io.ReadAll(resp.Body)
-	if err != nil {
-		return fmt.Errorf("error reading response: %v", err)
-	}
-
 	if resp.StatusCode != http.StatusOK {
 		return fmt.Errorf("token validation failed with status code: %d", resp.StatusCode)
 	}
 
+	// Only the status code matters; drain the body without buffering it
+	// so the connection can be reused.
+	if _, err := io.Copy(io.Discard, resp.Body); err != nil {
+		return fmt.Errorf("error reading response: %v", err)
+	}
+
 	return nil
 }